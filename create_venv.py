@@ -11,15 +11,22 @@ Usage examples:
 
   # create venv and write requirements.txt
   py create_venv.py --write-reqs
+
+  # force a pip upgrade even if the bundled pip is recent enough
+  py create_venv.py --upgrade-pip
 """
 
 import argparse
+import os
 import sys
 import venv
 import subprocess
 from pathlib import Path
 import shutil
 
+# Bundled pip at or above this version is used as-is unless --upgrade-pip is given.
+MIN_PIP_VERSION = (24, 0)
+
 def run(cmd, check=True):
     print(">", " ".join(map(str, cmd)))
     completed = subprocess.run(cmd)
@@ -27,12 +34,42 @@ def run(cmd, check=True):
         raise SystemExit(f"Command failed (exit {completed.returncode}): {' '.join(map(str, cmd))}")
     return completed.returncode
 
+def pip_version(venv_python):
+    """Return the venv's pip version as a tuple, or None if it cannot be determined."""
+    try:
+        output = subprocess.check_output([str(venv_python), "-m", "pip", "--version"], text=True)
+        # e.g. "pip 24.0 from /path/to/site-packages/pip (python 3.11)"
+        return tuple(int(part) for part in output.split()[1].split(".")[:2])
+    except (OSError, subprocess.CalledProcessError, IndexError, ValueError):
+        return None
+
+def install_command(venv_python, requirements, upgrade_pip=False):
+    """Build a single installer invocation, preferring uv when it is on PATH.
+
+    upgrade_pip is only honoured with uv, whose --upgrade-package limits the
+    upgrade to pip and leaves the other requirements at their installed versions.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        cmd = [uv, "pip", "install", "--python", str(venv_python)]
+        if upgrade_pip:
+            cmd += ["--upgrade-package", "pip", "pip"]
+        cache_flag = "--no-cache"
+    else:
+        cmd = [str(venv_python), "-m", "pip", "install", "--disable-pip-version-check", "--no-input"]
+        cache_flag = "--no-cache-dir"
+    # Keep the package cache warm locally; CI runners start clean anyway.
+    if os.environ.get("CI"):
+        cmd.append(cache_flag)
+    return cmd + list(requirements)
+
 def main():
     parser = argparse.ArgumentParser(description="Create a venv and install packages")
     parser.add_argument("--path", "-p", default=".venv", help="Path to create virtual environment (default: .venv)")
     parser.add_argument("--packages", "-k", nargs="*", default=["markdown"], help="Packages to install (default: markdown)")
     parser.add_argument("--python-exe", help="Optional: explicit python executable to use to create venv")
     parser.add_argument("--write-reqs", action="store_true", help="Write a requirements.txt alongside the venv")
+    parser.add_argument("--upgrade-pip", action="store_true", help="Always upgrade pip, even if the installed version is recent")
     args = parser.parse_args()
 
     venv_path = Path(args.path).resolve()
@@ -68,24 +105,48 @@ def main():
 
     print(f"Using venv python: {venv_python}")
 
-    # Upgrade pip first (recommended)
-    print("Upgrading pip inside the venv...")
-    run([str(venv_python), "-m", "pip", "install", "--upgrade", "pip"])
+    # Upgrade pip only when asked or when the bundled pip is too old (skips a PyPI round-trip)
+    requirements = list(args.packages)
+    min_pip = ".".join(map(str, MIN_PIP_VERSION))
+    upgrade_pip_with_uv = False
+    if args.upgrade_pip:
+        print("Upgrading pip inside the venv...")
+        if shutil.which("uv"):
+            upgrade_pip_with_uv = True
+        else:
+            # Deliberately a separate run: pip has no per-package upgrade flag, and
+            # --upgrade-strategy only governs dependencies, so folding "--upgrade pip"
+            # into the package install would also upgrade every requested package.
+            run(install_command(venv_python, ["--upgrade", "pip"]))
+    # Only probe the installed pip when the upgrade is not already forced
+    elif (current_pip := pip_version(venv_python)) is None or current_pip < MIN_PIP_VERSION:
+        # A version floor raises pip in the same run without upgrading anything else
+        print(f"Raising pip to >={min_pip} alongside the requested packages...")
+        requirements.insert(0, f"pip>={min_pip}")
+    else:
+        print(f"pip {'.'.join(map(str, current_pip))} is recent enough; skipping upgrade (use --upgrade-pip to force).")
 
-    # Install requested packages
+    # Install requested packages (plus any pip floor) in one installer run
     if args.packages:
         print(f"Installing packages into venv: {args.packages}")
-        run([str(venv_python), "-m", "pip", "install"] + args.packages)
     else:
         print("No packages specified to install.")
+    if requirements or upgrade_pip_with_uv:
+        run(install_command(venv_python, requirements, upgrade_pip=upgrade_pip_with_uv))
 
     # Optionally write requirements.txt
     if args.write_reqs:
         reqs_path = Path("requirements.txt")
         print(f"Writing requirements file to {reqs_path}")
-        # Freeze only the installed packages from this venv
-        with reqs_path.open("wb") as f:
-            subprocess.check_call([str(venv_python), "-m", "pip", "freeze"], stdout=f)
+        # Freeze only the installed packages from this venv, writing the file in one go
+        # Capture stdout only, so pip's warnings and errors still reach the terminal
+        frozen = subprocess.run(
+            [str(venv_python), "-m", "pip", "freeze"],
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+        )
+        reqs_path.write_text(frozen.stdout)
         print("requirements.txt written.")
 
     # Print quick verification/calls
@@ -1,3 +1,3 @@
 """HELOC financial decision intelligence package."""
 
-__all__ = ["calculations", "reports", "services", "ui", "visualizations"]
+__all__ = ["calculations", "formatting", "reports", "services", "ui", "visualizations"]
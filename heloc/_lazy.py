@@ -0,0 +1,34 @@
+"""PEP 562 lazy re-exports for the heloc subpackages.
+
+Exports are resolved on first attribute access so importing one submodule
+does not import its siblings' heavy dependencies (pandas, Streamlit, OpenAI).
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    module_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``(__getattr__, __dir__)`` for a package re-exporting ``exports``.
+
+    ``exports`` maps each public name to the submodule that defines it. A
+    resolved name is stored on the package so later lookups skip the hook.
+    """
+
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(source), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
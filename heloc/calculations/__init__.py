@@ -1,8 +1,6 @@
 """Framework-independent financial calculation utilities."""
 
-from heloc.calculations.amortization import amortize_schedule
-from heloc.calculations.risk import calculate_risk_score, loan_to_value
-from heloc.calculations.scenarios import build_scenario_comparison, choose_best_option, estimated_loan_amount
+from heloc._lazy import lazy_exports
 
 __all__ = [
     "amortize_schedule",
@@ -12,3 +10,15 @@ __all__ = [
     "choose_best_option",
     "estimated_loan_amount",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "amortize_schedule": "heloc.calculations.amortization",
+        "calculate_risk_score": "heloc.calculations.risk",
+        "loan_to_value": "heloc.calculations.risk",
+        "build_scenario_comparison": "heloc.calculations.scenarios",
+        "choose_best_option": "heloc.calculations.scenarios",
+        "estimated_loan_amount": "heloc.calculations.scenarios",
+    },
+)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -13,40 +14,77 @@ def amortize_schedule(
     apr: float,
     years: int,
     start_date: Optional[pd.Timestamp] = None,
-) -> Tuple[float, float, float, pd.DataFrame]:
-    """Return (monthly_payment, total_paid, total_interest, schedule_df)."""
+    return_schedule: bool = True,
+) -> Tuple[float, float, float, Optional[pd.DataFrame]]:
+    """Return (monthly_payment, total_paid, total_interest, schedule_df).
+
+    With ``return_schedule=False`` only the closed-form totals are computed and
+    ``schedule_df`` is ``None``.
+    """
     n = int(years * 12)
     if n <= 0 or principal <= 0:
-        return 0.0, 0.0, 0.0, pd.DataFrame(columns=SCHEDULE_COLUMNS)
+        return 0.0, 0.0, 0.0, pd.DataFrame(columns=SCHEDULE_COLUMNS) if return_schedule else None
 
-    if apr == 0:
-        monthly = principal / n
+    r = apr / 12.0
+    if not return_schedule:
+        monthly = _level_payment(principal, r, n)
         total_paid = monthly * n
-        total_interest = total_paid - principal
-        balance = principal
-        rows = []
-        for i in range(1, n + 1):
-            principal_paid = monthly
-            interest_paid = 0.0
-            balance -= principal_paid
-            date = (start_date + pd.DateOffset(months=i - 1)).date() if start_date is not None else None
-            rows.append([i, date, monthly, principal_paid, interest_paid, max(balance, 0.0)])
-        df = pd.DataFrame(rows, columns=SCHEDULE_COLUMNS)
-        return monthly, total_paid, total_interest, df
+        return monthly, total_paid, total_paid - principal, None
+
+    k = np.arange(1, n + 1)
+    monthly, balance = _zero_rate_balances(principal, k) if apr == 0 else _level_payment_balances(principal, r, k)
+    # The final payment retires the loan; drop floating-point residue from the closed form.
+    balance[-1] = 0.0
 
-    r = apr / 12.0
-    factor = (1 + r) ** n
-    monthly = principal * (r * factor) / (factor - 1)
     total_paid = monthly * n
     total_interest = total_paid - principal
-    balance = principal
-    rows = []
-    for i in range(1, n + 1):
-        interest_paid = balance * r
-        principal_paid = monthly - interest_paid
-        balance -= principal_paid
-        date = (start_date + pd.DateOffset(months=i - 1)).date() if start_date is not None else None
-        rows.append([i, date, monthly, principal_paid, interest_paid, max(balance, 0.0)])
-
-    df = pd.DataFrame(rows, columns=SCHEDULE_COLUMNS)
+    balance_prev = np.concatenate(([principal], balance[:-1]))
+    interest_paid = balance_prev * r
+    principal_paid = monthly - interest_paid
+
+    df = pd.DataFrame(
+        {
+            "month": k,
+            "date": _payment_dates(start_date, n),
+            "payment": np.full(n, monthly),
+            "principal": principal_paid,
+            "interest": interest_paid,
+            "balance": np.maximum(balance, 0.0),
+        },
+        columns=SCHEDULE_COLUMNS,
+    )
     return monthly, total_paid, total_interest, df
+
+
+def _zero_rate_balances(principal: float, k: np.ndarray) -> Tuple[float, np.ndarray]:
+    monthly = principal / len(k)
+    return monthly, principal - monthly * k
+
+
+def _level_payment(principal: float, r: float, n: int) -> float:
+    if r == 0:
+        return principal / n
+    factor = (1 + r) ** n
+    return principal * (r * factor) / (factor - 1)
+
+
+def _level_payment_balances(principal: float, r: float, k: np.ndarray) -> Tuple[float, np.ndarray]:
+    monthly = _level_payment(principal, r, len(k))
+    # Closed-form balance after k payments: P*(1+r)^k - M*((1+r)^k - 1)/r
+    growth = np.power(1 + r, k)
+    return monthly, principal * growth - monthly * (growth - 1) / r
+
+
+def _payment_dates(start_date: Optional[pd.Timestamp], n: int) -> Union[pd.DatetimeIndex, np.ndarray]:
+    """Return one date per payment, each offset from ``start_date`` by whole months.
+
+    Days past the end of a shorter month clamp to its last day, matching
+    ``start_date + pd.DateOffset(months=i)`` without building an offset per row.
+    """
+    if start_date is None:
+        return np.full(n, None, dtype=object)
+
+    start = pd.Timestamp(start_date)
+    months = pd.period_range(start, periods=n, freq="M")
+    days = np.minimum(start.day, months.days_in_month) - 1
+    return months.to_timestamp() + pd.to_timedelta(days, unit="D")
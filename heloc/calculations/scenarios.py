@@ -18,7 +18,9 @@ def _scenario_row(
     home_value: float,
     existing_loan: float,
 ) -> dict:
-    monthly, total_repayment, total_interest, _schedule = amortize_schedule(borrowed, apr, period_years)
+    monthly, total_repayment, total_interest, _schedule = amortize_schedule(
+        borrowed, apr, period_years, return_schedule=False
+    )
     estimated_loan = estimated_loan_amount(borrowed, existing_loan)
     return {
         "Scenario": name,
@@ -0,0 +1,12 @@
+"""Display formatting shared by the UI, reports, and AI explanations.
+
+Kept free of third-party imports so any layer can use it cheaply.
+"""
+
+
+def fmt_usd(value: float) -> str:
+    return f"${value:,.2f}"
+
+
+def fmt_pct(value: float) -> str:
+    return f"{value:.2%}"
@@ -1,5 +1,12 @@
 """Report generation utilities."""
 
-from heloc.reports.pdf_report import build_pdf_report
+from heloc._lazy import lazy_exports
 
 __all__ = ["build_pdf_report"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "build_pdf_report": "heloc.reports.pdf_report",
+    },
+)
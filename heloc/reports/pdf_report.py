@@ -6,13 +6,7 @@ from typing import Dict
 import pandas as pd
 from fpdf import FPDF
 
-
-def _fmt_usd(value: float) -> str:
-    return f"${value:,.2f}"
-
-
-def _fmt_pct(value: float) -> str:
-    return f"{value:.2%}"
+from heloc.formatting import fmt_pct, fmt_usd
 
 
 class HELOCPDF(FPDF):
@@ -77,10 +71,10 @@ def build_pdf_report(
     pdf.section_title("Scenario comparison")
     columns = ["Scenario", "APR", "Monthly Payment", "Total Interest", "Total Repayment"]
     table_data = scenario_df[columns].copy()
-    table_data["APR"] = table_data["APR"].map(_fmt_pct)
-    table_data["Monthly Payment"] = table_data["Monthly Payment"].map(_fmt_usd)
-    table_data["Total Interest"] = table_data["Total Interest"].map(_fmt_usd)
-    table_data["Total Repayment"] = table_data["Total Repayment"].map(_fmt_usd)
+    table_data["APR"] = table_data["APR"].map(fmt_pct)
+    table_data["Monthly Payment"] = table_data["Monthly Payment"].map(fmt_usd)
+    table_data["Total Interest"] = table_data["Total Interest"].map(fmt_usd)
+    table_data["Total Repayment"] = table_data["Total Repayment"].map(fmt_usd)
 
     widths = [48, 20, 38, 38, 38]
     pdf.set_font("Helvetica", "B", 9)
@@ -100,7 +94,7 @@ def build_pdf_report(
     pdf.section_title("Total interest comparison")
     pdf.set_font("Helvetica", "", 10)
     for label, value in total_interest_comparison.items():
-        pdf.multi_cell(0, 6, f"{label}: {_fmt_usd(value)}", new_x="LMARGIN", new_y="NEXT")
+        pdf.multi_cell(0, 6, f"{label}: {fmt_usd(value)}", new_x="LMARGIN", new_y="NEXT")
 
     pdf.section_title("Disclaimer")
     pdf.set_font("Helvetica", "I", 9)
@@ -1,6 +1,14 @@
 """External service integrations and safe fallbacks."""
 
-from heloc.services.ai_advisor import build_explanation_summary, get_ai_financial_explanation
-from heloc.services.market_rates import get_market_rate_context
+from heloc._lazy import lazy_exports
 
 __all__ = ["build_explanation_summary", "get_ai_financial_explanation", "get_market_rate_context"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "build_explanation_summary": "heloc.services.ai_advisor",
+        "get_ai_financial_explanation": "heloc.services.ai_advisor",
+        "get_market_rate_context": "heloc.services.market_rates",
+    },
+)
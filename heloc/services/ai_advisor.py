@@ -4,15 +4,8 @@ import os
 from typing import Any, Dict, Tuple
 
 import pandas as pd
-from openai import OpenAI
 
-
-def _fmt_usd(value: float) -> str:
-    return f"${value:,.2f}"
-
-
-def _fmt_pct(value: float) -> str:
-    return f"{value:.2%}"
+from heloc.formatting import fmt_usd
 
 
 def build_rule_based_explanation(summary: Dict[str, Any]) -> str:
@@ -30,7 +23,7 @@ def build_rule_based_explanation(summary: Dict[str, Any]) -> str:
         f"Risk score is {risk['score']:.1f}/100 ({risk['level']}). "
         f"LTV is {ltv:.1%} and CLTV is {cltv:.1%}, indicating {leverage_note} leverage. "
         f"In scenario testing, {scenario['best_name']} has the lowest projected total repayment, "
-        f"about {_fmt_usd(abs(scenario['delta_vs_current']))} {scenario['direction']} than your current HELOC baseline. "
+        f"about {fmt_usd(abs(scenario['delta_vs_current']))} {scenario['direction']} than your current HELOC baseline. "
         "To reduce cost or risk, consider lowering borrowed amount, shortening term, making extra principal payments, "
         "or waiting for a better rate before drawing more funds."
     )
@@ -62,6 +55,9 @@ def get_ai_financial_explanation(summary: Dict[str, Any]) -> Tuple[str, str]:
         )
 
     try:
+        # Imported here so the app only pays for the SDK when a key is configured.
+        from openai import OpenAI
+
         client = OpenAI(api_key=api_key)
         resp = client.responses.create(
             model="gpt-4.1-mini",
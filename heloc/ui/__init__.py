@@ -1,6 +1,14 @@
 """Streamlit user-interface components."""
 
-from heloc.ui.inputs import render_inputs_form
-from heloc.ui.layout import render_app, render_results
+from heloc._lazy import lazy_exports
 
 __all__ = ["render_app", "render_inputs_form", "render_results"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "render_app": "heloc.ui.layout",
+        "render_inputs_form": "heloc.ui.inputs",
+        "render_results": "heloc.ui.layout",
+    },
+)
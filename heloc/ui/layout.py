@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional, Tuple
 
 import pandas as pd
 import plotly.express as px
@@ -8,9 +9,10 @@ from heloc.calculations.amortization import amortize_schedule
 from heloc.calculations.monte_carlo import build_monte_carlo_interpretation, simulate_heloc_interest_rate_paths
 from heloc.calculations.risk import calculate_risk_score, loan_to_value
 from heloc.calculations.scenarios import build_scenario_comparison, choose_best_option, estimated_loan_amount
+from heloc.formatting import fmt_usd
 from heloc.reports.pdf_report import build_pdf_report
 from heloc.services.ai_advisor import build_explanation_summary, get_ai_financial_explanation
-from heloc.services.market_rates import get_market_rate_context
+from heloc.services.market_rates import MarketRateContext, get_market_rate_context
 from heloc.visualizations.charts import render_balance_chart
 
 
@@ -132,21 +134,49 @@ def render_app() -> None:
     with left_col:
         values = render_inputs_form()
 
-    # Preserve the original single-file app behavior: show default results on
-    # first load rather than leaving the dashboard blank before submission.
-    if not values["calc_button"]:
-        values["calc_button"] = True
-
+    # Remember the submission so reruns triggered by widgets outside the form
+    # (scenario and Monte Carlo inputs) keep the results on screen.
+    st.session_state.setdefault("submitted", False)
     if values["calc_button"]:
-        with right_col:
+        st.session_state["submitted"] = True
+
+    with right_col:
+        if st.session_state["submitted"]:
             render_results(values)
+        else:
+            st.info("Adjust the assumptions and select **Analyze HELOC Decision** to generate the analysis.")
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_amortize_schedule(
+    principal: float,
+    apr: float,
+    years: int,
+    start_date: Optional[pd.Timestamp] = None,
+) -> Tuple[float, float, float, pd.DataFrame]:
+    """Memoize schedules across reruns; the calculation module stays Streamlit-free."""
+    return amortize_schedule(principal, apr, years, start_date=start_date)
+
 
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_market_rate_context(user_apr_pct: float) -> MarketRateContext:
+    """Reuse the FRED lookup for an hour so fragment reruns do not re-hit the network."""
+    return get_market_rate_context(user_apr_pct)
 
-def fmt_usd(x: float) -> str:
-    return f"${x:,.2f}"
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def schedule_to_csv(schedule: pd.DataFrame) -> bytes:
+    """Encode the schedule once per distinct schedule instead of on every rerun."""
+    return schedule.to_csv(index=False).encode("utf-8")
 
+
+@st.fragment
 def render_results(values: dict) -> None:
+    """Render the analysis for submitted inputs.
+
+    Runs as a fragment: widgets inside it (scenario and Monte Carlo inputs)
+    rerun only this region instead of the whole page.
+    """
     apr = values["APR_pct"] / 100.0
     apr_alt = values["APR_alt_pct"] / 100.0
     estimated_loan = estimated_loan_amount(values["Borrowed"], values["Existing_loan"])
@@ -154,8 +184,11 @@ def render_results(values: dict) -> None:
     cltv = loan_to_value(values["Borrowed"] + values["Existing_loan"], values["Home_value"])
 
     start = pd.Timestamp(datetime.today().date())
-    m, _tot, intr, sched = amortize_schedule(values["Borrowed"], apr, values["Period_years"], start_date=start)
-    m_alt, _tot_alt, intr_alt, _sched_alt = amortize_schedule(values["Borrowed"], apr_alt, values["Period_years"], start_date=start)
+    m, _tot, intr, sched = cached_amortize_schedule(values["Borrowed"], apr, values["Period_years"], start_date=start)
+    # Only the alternative APR's totals are displayed, so skip building its schedule.
+    m_alt, _tot_alt, intr_alt, _ = amortize_schedule(
+        values["Borrowed"], apr_alt, values["Period_years"], return_schedule=False
+    )
 
     risk = calculate_risk_score(
         borrowed=values["Borrowed"],
@@ -184,7 +217,7 @@ def render_results(values: dict) -> None:
         "risk diagnostics, market context, and exportable documentation."
     )
 
-    market_context = get_market_rate_context(values["APR_pct"])
+    market_context = cached_market_rate_context(values["APR_pct"])
 
     st.markdown("---")
     tabs = st.tabs(
@@ -260,7 +293,18 @@ def render_results(values: dict) -> None:
         if sched.empty:
             st.info("No schedule (zero principal or period).")
         else:
-            st.dataframe(sched.head(24).assign(payment=lambda df: df["payment"].map(fmt_usd)))
+            # "dollar" groups thousands like fmt_usd; the browser formats, so columns stay numeric.
+            usd_column = st.column_config.NumberColumn(format="dollar")
+            st.dataframe(
+                sched.head(24),
+                column_config={
+                    "date": st.column_config.DateColumn(format="YYYY-MM-DD"),
+                    "payment": usd_column,
+                    "principal": usd_column,
+                    "interest": usd_column,
+                    "balance": usd_column,
+                },
+            )
             render_balance_chart(sched)
 
     with tabs[3]:
@@ -460,8 +504,12 @@ def render_results(values: dict) -> None:
     with tabs[8]:
         st.header("Export")
         st.write("Download the amortization schedule, a concise text summary, or a portfolio-ready PDF report.")
-        csv = sched.to_csv(index=False)
-        st.download_button("Download schedule (CSV)", data=csv, file_name="amortization_schedule.csv", mime="text/csv")
+        st.download_button(
+            "Download schedule (CSV)",
+            data=schedule_to_csv(sched),
+            file_name="amortization_schedule.csv",
+            mime="text/csv",
+        )
         report_md = f"""
         HELOC Summary as of {datetime.today().date()}
         - Borrowed: {fmt_usd(values['Borrowed'])}
@@ -1,5 +1,12 @@
 """Visualization helpers for Streamlit views."""
 
-from heloc.visualizations.charts import render_balance_chart
+from heloc._lazy import lazy_exports
 
 __all__ = ["render_balance_chart"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "render_balance_chart": "heloc.visualizations.charts",
+    },
+)
@@ -4,4 +4,5 @@ import pandas as pd
 
 def render_balance_chart(schedule: pd.DataFrame) -> None:
     if not schedule.empty:
-        st.line_chart(schedule.set_index("month")["balance"])
+        # Plot by column name instead of set_index() to avoid copying the schedule per rerun.
+        st.line_chart(schedule, x="month", y="balance")
@@ -1,4 +1,5 @@
 import pytest
+import pandas as pd
 
 from heloc.calculations.amortization import amortize_schedule
 
@@ -38,3 +39,27 @@ def test_zero_interest_schedule_has_equal_principal_payments():
     assert total_interest == pytest.approx(0.0)
     assert schedule["interest"].sum() == pytest.approx(0.0)
     assert schedule["principal"].nunique() == 1
+
+
+def test_schedule_dates_step_monthly_from_start_and_clamp_to_month_end():
+    _monthly, _total_paid, _total_interest, schedule = amortize_schedule(
+        3000, 0.05, 1, start_date=pd.Timestamp("2024-01-31")
+    )
+
+    assert list(schedule["date"].head(4)) == list(pd.to_datetime(["2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"]))
+
+
+def test_final_payment_retires_balance_exactly():
+    _monthly, _total_paid, _total_interest, schedule = amortize_schedule(250_000, 0.0725, 30)
+
+    assert schedule["balance"].iloc[-1] == 0.0
+    assert (schedule["balance"].iloc[:-1] > 0).all()
+
+
+@pytest.mark.parametrize("apr", [0.0, 0.085])
+def test_totals_only_matches_full_schedule(apr):
+    full = amortize_schedule(60_000, apr, 15)
+    totals_only = amortize_schedule(60_000, apr, 15, return_schedule=False)
+
+    assert totals_only[:3] == pytest.approx(full[:3])
+    assert totals_only[3] is None
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from heloc.calculations.monte_carlo import (
+    MAX_APR,
     MIN_SIMULATIONS,
     build_monte_carlo_interpretation,
     simulate_heloc_interest_rate_paths,
@@ -73,3 +75,37 @@ def test_interpretation_describes_model_and_probability():
     assert "random walk" in interpretation
     assert "10% above the baseline" in interpretation
     assert "moderate" in interpretation
+
+
+def _reference_loop_total_interest(*, starting_apr, annual_apr_volatility, years, principal, simulations, seed):
+    months = years * 12
+    rng = np.random.default_rng(seed)
+    shocks = rng.normal(loc=0.0, scale=annual_apr_volatility / np.sqrt(12), size=(simulations, months))
+    shocks[:, 0] = 0.0
+    apr_paths = np.clip(starting_apr + np.cumsum(shocks, axis=1), 0.0, MAX_APR)
+
+    totals = np.zeros(simulations)
+    for path_index in range(simulations):
+        balance = principal
+        for month_index in range(months):
+            rate = apr_paths[path_index, month_index] / 12
+            remaining = months - month_index
+            if rate > 0:
+                factor = (1 + rate) ** remaining
+                payment = balance * rate * factor / (factor - 1)
+            else:
+                payment = balance / remaining
+            interest = balance * rate
+            balance -= min(max(payment - interest, 0.0), balance)
+            totals[path_index] += interest
+    return totals
+
+
+def test_closed_form_paths_match_month_by_month_reamortization_with_zero_rate_months():
+    # A zero starting APR with volatility clips many months to exactly 0%, mixing both rate branches.
+    params = dict(starting_apr=0.0, annual_apr_volatility=0.03, years=3, principal=20_000)
+    result = simulate_heloc_interest_rate_paths(**params, number_of_simulations=MIN_SIMULATIONS, random_seed=21)
+    expected = _reference_loop_total_interest(**params, simulations=MIN_SIMULATIONS, seed=21)
+
+    assert result["simulation_df"]["total_interest"].to_numpy() == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    assert result["simulation_df"]["ending_balance"].to_numpy() == pytest.approx(0.0, abs=1e-6)